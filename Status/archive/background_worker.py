@@ -9,21 +9,73 @@ while continuing orchestration of other tasks.
 
 Features:
 - Thread-based async execution
+- Optional process pool for CPU-bound tasks
+- asyncio front-end for awaiting results from an event loop
+- Optional CPU/NUMA pinning of worker threads
 - Task status tracking
 - Result collection
 - Error handling and propagation
 - Thread-safe queue operations
 """
 
+import asyncio
+import glob
+import multiprocessing
+import os
 import threading
-import queue
 import time
-from dataclasses import dataclass, field
+from collections import OrderedDict, deque
+from concurrent.futures import CancelledError, Future, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from enum import Enum
-from typing import Any, Callable, Dict, Optional, List
+from typing import Any, Callable, Coroutine, Deque, Dict, Literal, Optional, List, Set, Tuple
 from datetime import datetime
 
 
+# "thread" runs the callable on a worker thread (I/O-bound work);
+# "process" runs it in a process pool, outside the GIL (CPU-bound work)
+ExecutorKind = Literal["thread", "process"]
+
+
+# Marks threads running a task (worker threads, and callers while an
+# inline task runs), so a task submitted from inside another task is never
+# run inline
+_worker_context = threading.local()
+
+
+def detect_numa_nodes() -> List[Set[int]]:
+    """
+    Read the host's NUMA topology from sysfs (Linux only)
+    
+    Returns:
+        One set of CPU ids per NUMA node, restricted to the CPUs this
+        process may run on; empty if the topology isn't available
+    """
+    if not hasattr(os, "sched_getaffinity"):
+        return []
+    allowed = os.sched_getaffinity(0)
+    
+    def node_index(path: str) -> int:
+        # .../node12/cpulist -> 12
+        return int(os.path.basename(os.path.dirname(path))[len("node"):])
+    
+    nodes = []
+    paths = glob.glob("/sys/devices/system/node/node[0-9]*/cpulist")
+    for path in sorted(paths, key=node_index):
+        cpus: Set[int] = set()
+        with open(path) as f:
+            for part in f.read().strip().split(","):
+                if "-" in part:
+                    lo, hi = part.split("-")
+                    cpus.update(range(int(lo), int(hi) + 1))
+                elif part:
+                    cpus.add(int(part))
+        cpus &= allowed
+        if cpus:
+            nodes.append(cpus)
+    return nodes
+
+
 class TaskStatus(Enum):
     """Status of a background task"""
     QUEUED = "queued"
@@ -33,19 +85,69 @@ class TaskStatus(Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
 class BackgroundTask:
-    """Represents a task to be executed in background"""
-    task_id: str
-    callable: Callable
-    args: tuple = field(default_factory=tuple)
-    kwargs: dict = field(default_factory=dict)
-    status: TaskStatus = TaskStatus.QUEUED
-    result: Any = None
-    error: Optional[Exception] = None
-    submitted_at: float = field(default_factory=time.time)
-    started_at: Optional[float] = None
-    completed_at: Optional[float] = None
+    """
+    Represents a task to be executed in background
+    
+    Slotted: a worker may hold many thousands of these, and dropping the
+    per-instance __dict__ roughly halves their size. Written out by hand
+    because dataclass(slots=True) needs Python 3.10.
+    """
+    
+    __slots__ = (
+        "task_id", "callable", "args", "kwargs", "kind", "retain_args",
+        "status", "result", "error",
+        "submitted_at", "submitted_wall", "started_at", "completed_at",
+        "future", "submitted_iso", "started_iso", "completed_iso",
+    )
+    
+    def __init__(
+        self,
+        task_id: str,
+        callable: Optional[Callable],
+        args: tuple = (),
+        kwargs: Optional[dict] = None,
+        kind: ExecutorKind = "thread",
+        retain_args: bool = False,
+        status: TaskStatus = TaskStatus.QUEUED,
+        result: Any = None,
+        error: Optional[Exception] = None,
+        submitted_at: Optional[float] = None,
+        submitted_wall: Optional[float] = None,
+        started_at: Optional[float] = None,
+        completed_at: Optional[float] = None,
+        future: Optional[Future] = None
+    ):
+        self.task_id = task_id
+        # callable/args/kwargs are dropped once the task finishes, unless
+        # retain_args is set, so large inputs can be reclaimed early
+        self.callable = callable
+        self.args = args
+        self.kwargs = {} if kwargs is None else kwargs
+        self.kind = kind
+        self.retain_args = retain_args
+        self.status = status
+        self.result = result
+        self.error = error
+        # *_at are time.monotonic() readings, used for durations; the single
+        # wall-clock reading at submission anchors the ISO renderings
+        self.submitted_at = time.monotonic() if submitted_at is None else submitted_at
+        self.submitted_wall = time.time() if submitted_wall is None else submitted_wall
+        self.started_at = started_at
+        self.completed_at = completed_at
+        self.future = Future() if future is None else future
+        # ISO renderings of the timestamps, formatted once when each is set
+        self.submitted_iso = datetime.fromtimestamp(self.submitted_wall).isoformat()
+        self.started_iso: Optional[str] = None
+        self.completed_iso: Optional[str] = None
+    
+    def __repr__(self) -> str:
+        return f"BackgroundTask(task_id={self.task_id!r}, status={self.status})"
+    
+    def iso_at(self, monotonic_ts: float) -> str:
+        """Render a monotonic reading taken during this task's life as ISO"""
+        wall = self.submitted_wall + (monotonic_ts - self.submitted_at)
+        return datetime.fromtimestamp(wall).isoformat()
 
 
 class BackgroundWorker:
@@ -57,35 +159,97 @@ class BackgroundWorker:
     or retrieved when ready.
     """
     
-    def __init__(self, max_workers: int = 3):
+    def __init__(
+        self,
+        max_workers: int = 3,
+        executor: ExecutorKind = "thread",
+        max_retained: Optional[int] = 10_000,
+        numa_nodes: Optional[List[Set[int]]] = None
+    ):
         """
         Initialize background worker system
         
         Args:
             max_workers: Maximum number of concurrent background threads
+            executor: Default execution kind for submitted tasks. With
+                "process", callables and their arguments must be picklable.
+            max_retained: Number of finished (completed, failed or cancelled)
+                tasks kept for status/result lookups; older ones are dropped
+                as new tasks are submitted. None keeps every task.
+            numa_nodes: CPU sets, one per node (see detect_numa_nodes).
+                Workers are assigned to nodes round-robin and pinned to
+                their node's CPUs; tasks submitted with prefer_node are
+                run by that node's workers when they are free. None
+                leaves threads unpinned.
+        
+        Raises:
+            ValueError: If a node lists CPUs this process can't run on
         """
+        self._check_kind(executor)
+        if numa_nodes is not None:
+            if not hasattr(os, "sched_setaffinity"):
+                raise ValueError("CPU pinning is not supported on this platform")
+            if not numa_nodes:
+                raise ValueError("numa_nodes must list at least one node")
+            allowed = os.sched_getaffinity(0)
+            for cpus in numa_nodes:
+                if not cpus or not set(cpus) <= allowed:
+                    raise ValueError(
+                        f"CPU set {sorted(cpus)} is not within allowed CPUs {sorted(allowed)}"
+                    )
         self.max_workers = max_workers
-        self.task_queue: queue.Queue = queue.Queue()
+        self.executor = executor
+        self.max_retained = max_retained
+        # Finished tasks in completion order, oldest first, for eviction.
+        # An OrderedDict used as an ordered set: purge() removes any task
+        # in O(1), and popitem(last=False) takes the oldest in O(1)
+        self._finished: OrderedDict[BackgroundTask, None] = OrderedDict()
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._q: Deque[BackgroundTask] = deque()
+        self.numa_nodes = numa_nodes
+        # Per-node queues for tasks submitted with prefer_node
+        self._node_q: List[Deque[BackgroundTask]] = [deque() for _ in numa_nodes or ()]
         self.tasks: Dict[str, BackgroundTask] = {}
         self.workers: List[threading.Thread] = []
         self.shutdown_flag = threading.Event()
+        # Guards changes to self.tasks, the queues and _finished: it is
+        # taken by submits (which also evict), by purge(), and by _retire()
+        # each time a task finishes or is cancelled. Readers don't take it:
+        # dict lookups and attribute loads are atomic under the GIL, and
+        # writers publish status only after the other fields. Setting a
+        # task's status doesn't take it either: the start/cancel race is
+        # settled by each task's Future, and only the worker that started
+        # a task ever completes it.
         self._lock = threading.Lock()
+        # Wakes idle workers when a queue gets work; shares _lock so a
+        # submit inserts and enqueues under a single acquisition. Busy
+        # workers pop without it (see _pop_first).
+        self._cv = threading.Condition(self._lock)
         
         # Start worker threads
         for i in range(max_workers):
+            node = i % len(numa_nodes) if numa_nodes else None
             worker = threading.Thread(
                 target=self._worker_loop,
+                args=(node,),
                 name=f"BackgroundWorker-{i}",
                 daemon=True
             )
             worker.start()
             self.workers.append(worker)
+        
+        if executor == "process":
+            self._process_pool = self._new_process_pool()
     
     def submit_task(
         self,
         task_id: str,
         callable: Callable,
         *args,
+        kind: Optional[ExecutorKind] = None,
+        prefer_node: Optional[int] = None,
+        retain_args: bool = False,
+        inline_if_idle: bool = False,
         **kwargs
     ) -> str:
         """
@@ -95,6 +259,14 @@ class BackgroundWorker:
             task_id: Unique identifier for the task
             callable: Function to execute
             *args: Positional arguments for callable
+            kind: Override the worker's default execution kind
+            prefer_node: Index into numa_nodes whose workers should run it
+            retain_args: Keep callable and arguments on the task after it
+                finishes (for debugging); by default they are released
+            inline_if_idle: Run the task synchronously on the calling
+                thread when nothing is queued, skipping the hand-off to a
+                worker. Meant for cheap callables; ignored for process
+                tasks, with prefer_node, or when called from a task.
             **kwargs: Keyword arguments for callable
             
         Returns:
@@ -103,21 +275,120 @@ class BackgroundWorker:
         Raises:
             ValueError: If task_id already exists
         """
-        with self._lock:
-            if task_id in self.tasks:
-                raise ValueError(f"Task {task_id} already exists")
-            
+        if inline_if_idle and self._can_run_inline(kind or self.executor, prefer_node):
             bg_task = BackgroundTask(
                 task_id=task_id,
                 callable=callable,
                 args=args,
-                kwargs=kwargs
+                kwargs=kwargs,
+                retain_args=retain_args
             )
+            with self._lock:
+                self._insert([bg_task])
+                self._evict_finished()
+            # Flag this thread as running a task for the duration, so an
+            # inline_if_idle submit from inside the task is queued instead
+            # of nesting another inline run
+            outer = getattr(_worker_context, "active", False)
+            _worker_context.active = True
+            try:
+                self._run(bg_task)
+            finally:
+                _worker_context.active = outer
+            return bg_task.task_id
+        
+        return self.submit_tasks(
+            [(task_id, callable, args, kwargs)],
+            kind=kind,
+            prefer_node=prefer_node,
+            retain_args=retain_args
+        )[0]
+    
+    def submit_tasks(
+        self,
+        specs: List[Tuple[str, Callable, tuple, dict]],
+        kind: Optional[ExecutorKind] = None,
+        prefer_node: Optional[int] = None,
+        retain_args: bool = False
+    ) -> List[str]:
+        """
+        Submit several tasks for background execution at once
+        
+        All tasks are queued under a single lock acquisition and idle
+        workers are woken with one notify, which is cheaper than calling
+        submit_task in a loop when dispatching many small tasks.
+        
+        Args:
+            specs: (task_id, callable, args, kwargs) tuples
+            kind: Override the worker's default execution kind for the batch
+            prefer_node: Index into numa_nodes whose workers should run the batch
+            retain_args: Keep callables and arguments after tasks finish
+            
+        Returns:
+            Task IDs in submission order
             
-            self.tasks[task_id] = bg_task
-            self.task_queue.put(bg_task)
+        Raises:
+            ValueError: If any task_id already exists or is repeated;
+                no task from the batch is submitted in that case.
+                Also if prefer_node isn't a configured node.
+        """
+        kind = kind or self.executor
+        self._check_kind(kind)
+        if prefer_node is not None and not 0 <= prefer_node < len(self._node_q):
+            raise ValueError(f"Unknown NUMA node: {prefer_node}")
+        queue = self._q if prefer_node is None else self._node_q[prefer_node]
+        
+        bg_tasks = [
+            BackgroundTask(
+                task_id=task_id,
+                callable=callable,
+                args=args,
+                kwargs=kwargs,
+                kind=kind,
+                retain_args=retain_args
+            )
+            for task_id, callable, args, kwargs in specs
+        ]
         
-        return task_id
+        with self._cv:
+            self._insert(bg_tasks)
+            
+            # Checked under the lock: shutdown() sets the flag before its
+            # own _cv block, so a batch either sees the flag here or is
+            # inserted before shutdown() cancels the tracked tasks
+            if self.shutdown_flag.is_set():
+                # No worker will run these; make get_result() report the
+                # shutdown rather than wait forever
+                for bg_task in bg_tasks:
+                    bg_task.future.cancel()
+                return [bg_task.task_id for bg_task in bg_tasks]
+            
+            if kind == "process" and self._process_pool is None:
+                self._process_pool = self._new_process_pool()
+            
+            queue.extend(bg_tasks)
+            self._cv.notify(len(bg_tasks))
+            
+            self._evict_finished()
+        
+        return [bg_task.task_id for bg_task in bg_tasks]
+    
+    def get_future(self, task_id: str) -> Future:
+        """
+        Get the Future that settles when a task finishes
+        
+        Lets callers wait on many tasks at once with
+        concurrent.futures.wait() or as_completed() instead of polling
+        get_status(). The Future is cancelled if the task is cancelled or
+        the worker shuts down first. Don't resolve it yourself.
+        
+        Args:
+            task_id: Task identifier
+            
+        Raises:
+            KeyError: If task_id doesn't exist
+        """
+        return self._get_task(task_id).future
     
     def get_status(self, task_id: str) -> TaskStatus:
         """
@@ -132,10 +403,7 @@ class BackgroundWorker:
         Raises:
             KeyError: If task_id doesn't exist
         """
-        with self._lock:
-            if task_id not in self.tasks:
-                raise KeyError(f"Task {task_id} not found")
-            return self.tasks[task_id].status
+        return self._get_task(task_id).status
     
     def get_result(self, task_id: str, timeout: Optional[float] = None) -> Any:
         """
@@ -151,39 +419,65 @@ class BackgroundWorker:
         Raises:
             KeyError: If task doesn't exist
             TimeoutError: If timeout exceeded
-            RuntimeError: If worker shutdown before task completed
+            RuntimeError: If task was cancelled or worker shutdown before it started
             Exception: If task failed, re-raises the original exception
         """
-        start_time = time.time()
+        return self._result_of(self._get_task(task_id), timeout)
+    
+    async def await_result(self, task_id: str) -> Any:
+        """
+        Await result of a task from a running event loop
         
-        while True:
-            with self._lock:
-                if task_id not in self.tasks:
-                    raise KeyError(f"Task {task_id} not found")
-                
-                task = self.tasks[task_id]
-                
-                if task.status == TaskStatus.COMPLETED:
-                    return task.result
-                elif task.status == TaskStatus.FAILED:
-                    raise task.error
-                elif task.status == TaskStatus.CANCELLED:
-                    raise RuntimeError(f"Task {task_id} was cancelled")
+        The event loop thread is never blocked: completion of the task
+        schedules a wakeup on the loop, so other coroutines keep running
+        while the task executes.
+        
+        Args:
+            task_id: Task identifier
             
-            # Check if worker has been shutdown
-            if self.shutdown_flag.is_set():
-                with self._lock:
-                    task = self.tasks[task_id]
-                    if task.status not in [TaskStatus.COMPLETED, TaskStatus.FAILED]:
-                        raise RuntimeError(f"Worker shutdown before task {task_id} completed")
+        Returns:
+            Task result
             
-            # Check timeout
-            if timeout is not None:
-                if time.time() - start_time > timeout:
-                    raise TimeoutError(f"Task {task_id} did not complete within {timeout}s")
+        Raises:
+            Same as get_result()
+        """
+        task = self._get_task(task_id)
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        
+        def wake():
+            if not waiter.done():  # Awaiting coroutine may have been cancelled
+                waiter.set_result(None)
+        
+        def on_done(_future: Future):
+            try:
+                loop.call_soon_threadsafe(wake)
+            except RuntimeError:
+                pass  # Loop already closed; nobody is waiting any more
+        
+        # Runs immediately if the task has already finished
+        task.future.add_done_callback(on_done)
+        await waiter
+        
+        # From the task already in hand: by now it may have been evicted
+        # or purged, and a lookup by ID would fail
+        return self._result_of(task, timeout=0)
+    
+    def submit_coroutine(self, task_id: str, coro: Coroutine) -> str:
+        """
+        Submit a coroutine to run on its own event loop in a worker thread
+        
+        Args:
+            task_id: Unique identifier for the task
+            coro: Coroutine object to run
+            
+        Returns:
+            Task ID for status tracking
             
-            # Wait a bit before checking again
-            time.sleep(0.1)
+        Raises:
+            ValueError: If task_id already exists
+        """
+        return self.submit_task(task_id, asyncio.run, coro, kind="thread")
     
     def cancel_task(self, task_id: str) -> bool:
         """
@@ -195,17 +489,39 @@ class BackgroundWorker:
         Returns:
             True if cancelled, False if already running/completed
         """
-        with self._lock:
-            if task_id not in self.tasks:
-                raise KeyError(f"Task {task_id} not found")
-            
-            task = self.tasks[task_id]
-            
-            if task.status == TaskStatus.QUEUED:
-                task.status = TaskStatus.CANCELLED
-                return True
+        task = self._get_task(task_id)
+        
+        # Future.cancel() succeeds only while the task is still pending,
+        # atomically with the worker's set_running_or_notify_cancel()
+        if task.future.cancel():
+            task.status = TaskStatus.CANCELLED
+            self._release_inputs(task)
+            self._retire(task)
+            return True
+        
+        return False
+    
+    def purge(self, task_id: str):
+        """
+        Stop tracking a finished task, releasing its result
+        
+        Args:
+            task_id: Task identifier
             
-            return False
+        Raises:
+            KeyError: If task_id doesn't exist
+            ValueError: If task is still queued or running
+        """
+        task = self._get_task(task_id)
+        if not task.future.done():
+            raise ValueError(f"Task {task_id} has not finished")
+        
+        with self._lock:
+            if self.tasks.get(task_id) is task:
+                del self.tasks[task_id]
+                # Also forget it for eviction, which would otherwise keep
+                # the result alive until max_retained newer tasks finish
+                self._finished.pop(task, None)
     
     def get_task_info(self, task_id: str) -> Dict[str, Any]:
         """
@@ -217,30 +533,7 @@ class BackgroundWorker:
         Returns:
             Dictionary with task details
         """
-        with self._lock:
-            if task_id not in self.tasks:
-                raise KeyError(f"Task {task_id} not found")
-            
-            task = self.tasks[task_id]
-            
-            info = {
-                "task_id": task.task_id,
-                "status": task.status.value,
-                "submitted_at": datetime.fromtimestamp(task.submitted_at).isoformat(),
-            }
-            
-            if task.started_at:
-                info["started_at"] = datetime.fromtimestamp(task.started_at).isoformat()
-                info["running_time"] = time.time() - task.started_at
-            
-            if task.completed_at:
-                info["completed_at"] = datetime.fromtimestamp(task.completed_at).isoformat()
-                info["total_time"] = task.completed_at - task.submitted_at
-            
-            if task.error:
-                info["error"] = str(task.error)
-            
-            return info
+        return self._task_info(self._get_task(task_id))
     
     def list_tasks(self) -> List[Dict[str, Any]]:
         """
@@ -249,8 +542,35 @@ class BackgroundWorker:
         Returns:
             List of task info dictionaries
         """
-        with self._lock:
-            return [self.get_task_info(tid) for tid in self.tasks.keys()]
+        # list() copies the values in one step under the GIL, so a
+        # concurrent submit can't change the dict while we iterate
+        return [self._task_info(task) for task in list(self.tasks.values())]
+    
+    @staticmethod
+    def _task_info(task: BackgroundTask) -> Dict[str, Any]:
+        """Build the info dict for a task; takes no locks"""
+        # Read each field once; a worker may be transitioning the task
+        status = task.status
+        info = {
+            "task_id": task.task_id,
+            "status": status.value,
+            "submitted_at": task.submitted_iso,
+        }
+        
+        started_at = task.started_at
+        if started_at:
+            info["started_at"] = task.started_iso
+            info["running_time"] = time.monotonic() - started_at
+        
+        completed_at = task.completed_at
+        if completed_at:
+            info["completed_at"] = task.completed_iso
+            info["total_time"] = completed_at - task.submitted_at
+        
+        if task.error:
+            info["error"] = str(task.error)
+        
+        return info
     
     def shutdown(self, wait: bool = True):
         """
@@ -261,52 +581,239 @@ class BackgroundWorker:
         """
         self.shutdown_flag.set()
         
+        with self._cv:
+            # Wake idle workers so they exit now rather than on next submit
+            self._cv.notify_all()
+        
+        # Queued tasks will never start; cancelling their futures wakes
+        # get_result() waiters. cancel() is a no-op on running/done tasks.
+        # Tasks submitted from here on are cancelled by submit_tasks.
+        for task in list(self.tasks.values()):
+            task.future.cancel()
+        
         if wait:
             for worker in self.workers:
                 worker.join()
+        
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=wait)
     
-    def _worker_loop(self):
+    def _new_process_pool(self) -> ProcessPoolExecutor:
         """
-        Main worker thread loop - processes tasks from queue
+        Create the process pool for "process" tasks
+        
+        Children are spawned, not forked: the pool is started while our
+        worker threads are running, and forking a multi-threaded process
+        can deadlock the child on a lock another thread held.
         """
-        while not self.shutdown_flag.is_set():
+        return ProcessPoolExecutor(
+            self.max_workers, mp_context=multiprocessing.get_context("spawn")
+        )
+    
+    @staticmethod
+    def _check_kind(kind: str):
+        """Reject unknown execution kinds"""
+        if kind not in ("thread", "process"):
+            raise ValueError(f"Unknown executor kind: {kind}")
+    
+    def _insert(self, bg_tasks: List[BackgroundTask]):
+        """Start tracking new tasks, all or none; caller holds _lock"""
+        # One hash probe per task: setdefault both checks and inserts,
+        # and also catches IDs repeated within the batch
+        for i, bg_task in enumerate(bg_tasks):
+            if self.tasks.setdefault(bg_task.task_id, bg_task) is not bg_task:
+                for added in bg_tasks[:i]:
+                    del self.tasks[added.task_id]
+                raise ValueError(f"Task {bg_task.task_id} already exists")
+    
+    def _result_of(self, task: BackgroundTask, timeout: Optional[float]) -> Any:
+        """Wait for a task and return its result; see get_result()"""
+        # exception() rather than result(), so a task that itself raised
+        # TimeoutError isn't mistaken for our wait timing out
+        try:
+            error = task.future.exception(timeout)
+        except FuturesTimeoutError:
+            raise TimeoutError(f"Task {task.task_id} did not complete within {timeout}s") from None
+        except CancelledError:
+            if self.shutdown_flag.is_set() and task.status != TaskStatus.CANCELLED:
+                raise RuntimeError(f"Worker shutdown before task {task.task_id} completed") from None
+            raise RuntimeError(f"Task {task.task_id} was cancelled") from None
+        
+        if error is not None:
+            raise error
+        return task.future.result()
+    
+    def _can_run_inline(self, kind: ExecutorKind, prefer_node: Optional[int]) -> bool:
+        """Whether an inline_if_idle submit may run on the calling thread"""
+        self._check_kind(kind)
+        if kind != "thread" or prefer_node is not None:
+            return False
+        if self.shutdown_flag.is_set() or getattr(_worker_context, "active", False):
+            return False
+        # Approximate, without the lock: a racing submit only means this
+        # task runs inline next to queued work, never that work is lost
+        return not self._q and not any(self._node_q)
+    
+    @staticmethod
+    def _release_inputs(task: BackgroundTask):
+        """
+        Drop a task's callable and arguments, unless retain_args is set
+        
+        Called before the task's future is resolved, so anyone woken by
+        it already sees them gone. Nothing reads them once the task has
+        run, so dropping them is safe.
+        """
+        if not task.retain_args:
+            task.callable = None
+            task.args = ()
+            task.kwargs = {}
+    
+    def _retire(self, task: BackgroundTask):
+        """
+        Queue a finished task for eviction
+        
+        Takes _lock, so a purge() that runs as the task finishes can't
+        leave it in the eviction queue.
+        """
+        if self.max_retained is not None:
+            with self._lock:
+                # Skip if purge() already dropped it
+                if self.tasks.get(task.task_id) is task:
+                    self._finished[task] = None
+    
+    def _evict_finished(self):
+        """Drop the oldest finished tasks beyond max_retained; caller holds _lock"""
+        if self.max_retained is None:
+            return
+        
+        while len(self._finished) > self.max_retained:
+            task, _ = self._finished.popitem(last=False)
+            # Skip tasks already purged, or whose ID was since reused
+            if self.tasks.get(task.task_id) is task:
+                del self.tasks[task.task_id]
+    
+    def _get_task(self, task_id: str) -> BackgroundTask:
+        """
+        Look up a task without taking the lock
+        
+        Raises:
+            KeyError: If task_id doesn't exist
+        """
+        task = self.tasks.get(task_id)
+        if task is None:
+            raise KeyError(f"Task {task_id} not found")
+        return task
+    
+    def _search_order(self, node: Optional[int]) -> List[Deque[BackgroundTask]]:
+        """
+        Queues a worker on `node` takes work from, in order
+        
+        The node's own queue first, then the shared queue, then the other
+        nodes' queues, so no worker idles while work is pending anywhere.
+        """
+        local = [self._node_q[node]] if node is not None else []
+        others = [q for i, q in enumerate(self._node_q) if i != node]
+        return local + [self._q] + others
+    
+    @staticmethod
+    def _pop_first(queues: List[Deque[BackgroundTask]]) -> Optional[BackgroundTask]:
+        """
+        Pop from the first non-empty queue, or return None
+        
+        Safe without _lock: deque.popleft() is atomic, and losing a race
+        with another worker for the last item just raises IndexError.
+        """
+        for queue in queues:
             try:
-                # Get task from queue (with timeout to check shutdown flag)
-                task = self.task_queue.get(timeout=0.5)
-            except queue.Empty:
+                return queue.popleft()
+            except IndexError:
                 continue
+        return None
+    
+    def _worker_loop(self, node: Optional[int] = None):
+        """
+        Main worker thread loop - processes tasks from queue
+        
+        Args:
+            node: Index into numa_nodes this worker is pinned to, if any
+        """
+        if node is not None:
+            # pid 0 is the calling thread on Linux
+            os.sched_setaffinity(0, self.numa_nodes[node])
+        
+        queues = self._search_order(node)
+        _worker_context.active = True
+        
+        while not self.shutdown_flag.is_set():
+            # Fast path: while there is a backlog, pop without the lock
+            task = self._pop_first(queues)
             
-            # Check if task was cancelled while in queue
-            with self._lock:
-                if task.status == TaskStatus.CANCELLED:
-                    self.task_queue.task_done()
-                    continue
-                
-                # Mark as running
-                task.status = TaskStatus.RUNNING
-                task.started_at = time.time()
+            if task is None:
+                # Submits enqueue under the lock, so re-checking under it
+                # before waiting can't miss a notify
+                with self._cv:
+                    task = self._pop_first(queues)
+                    while task is None and not self.shutdown_flag.is_set():
+                        self._cv.wait()
+                        task = self._pop_first(queues)
+                    
+                    if self.shutdown_flag.is_set():
+                        return
             
-            # Execute the task
-            try:
+            # The popped task is owned by this worker; only a concurrent
+            # cancel_task can race with starting it, and the future's own
+            # lock settles that
+            self._run(task)
+    
+    def _run(self, task: BackgroundTask):
+        """Claim and execute a task on the calling thread, unless it was cancelled"""
+        if not task.future.set_running_or_notify_cancel():
+            return
+        
+        # Mark as running
+        now = time.monotonic()
+        task.started_iso = task.iso_at(now)
+        task.started_at = now
+        task.status = TaskStatus.RUNNING
+        
+        # Execute the task
+        try:
+            if task.kind == "process":
+                # The thread blocks on the future (GIL released) while
+                # the callable runs in a separate interpreter
+                result = self._process_pool.submit(
+                    task.callable, *task.args, **task.kwargs
+                ).result()
+            else:
                 result = task.callable(*task.args, **task.kwargs)
                 
-                with self._lock:
-                    task.result = result
-                    task.status = TaskStatus.COMPLETED
-                    task.completed_at = time.time()
-                    
-            except Exception as e:
-                with self._lock:
-                    task.error = e
-                    task.status = TaskStatus.FAILED
-                    task.completed_at = time.time()
-            
-            finally:
-                self.task_queue.task_done()
+        except Exception as e:
+            now = time.monotonic()
+            task.error = e
+            task.completed_iso = task.iso_at(now)
+            task.completed_at = now
+            task.status = TaskStatus.FAILED
+            self._release_inputs(task)
+            task.future.set_exception(e)
+        
+        else:
+            now = time.monotonic()
+            task.result = result
+            # From here only the task holds the result, so purging the
+            # task once waiters wake is enough to free it
+            del result
+            task.completed_iso = task.iso_at(now)
+            task.completed_at = now
+            task.status = TaskStatus.COMPLETED
+            self._release_inputs(task)
+            task.future.set_result(task.result)
+        
+        self._retire(task)
 
 
 # Global worker instance for convenience
 _global_worker: Optional[BackgroundWorker] = None
+_global_worker_lock = threading.Lock()
 
 
 def get_global_worker() -> BackgroundWorker:
@@ -317,8 +824,11 @@ def get_global_worker() -> BackgroundWorker:
         Global BackgroundWorker instance
     """
     global _global_worker
+    # Lock only on first use; once set, callers just read the global
     if _global_worker is None:
-        _global_worker = BackgroundWorker()
+        with _global_worker_lock:
+            if _global_worker is None:
+                _global_worker = BackgroundWorker()
     return _global_worker
 
 
@@ -337,3 +847,17 @@ def delegate_to_background(task_id: str, callable: Callable, *args, **kwargs) ->
     """
     worker = get_global_worker()
     return worker.submit_task(task_id, callable, *args, **kwargs)
+
+
+def delegate_many(specs: List[Tuple[str, Callable, tuple, dict]]) -> List[str]:
+    """
+    Convenience function to delegate a batch of tasks to global background worker
+    
+    Args:
+        specs: (task_id, callable, args, kwargs) tuples
+        
+    Returns:
+        Task IDs for tracking
+    """
+    worker = get_global_worker()
+    return worker.submit_tasks(specs)
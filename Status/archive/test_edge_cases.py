@@ -98,6 +98,33 @@ class TestZenTasksEdgeCases:
         # Task should not be ready (dependency not met)
         assert t1 not in ready
     
+    def test_reopened_dependency(self):
+        """Test that reopening a completed dependency blocks its dependents again"""
+        zen = ZenTasks()
+        t1 = zen.create_task("Task 1", RoleType.PLANNER)
+        t2 = zen.create_task("Task 2", RoleType.ARCHITECT, [t1.id])
+        
+        zen.update_task(t1.id, "completed")
+        assert zen.get_ready_tasks() == [t2]
+        
+        zen.update_task(t1.id, "pending")
+        assert zen.get_ready_tasks() == [t1]
+    
+    def test_ready_order_after_status_round_trip(self):
+        """Test that a task leaving and re-entering pending keeps creation order"""
+        zen = ZenTasks()
+        t1 = zen.create_task("Task 1", RoleType.PLANNER)
+        t2 = zen.create_task("Task 2", RoleType.PLANNER)
+        t3 = zen.create_task("Task 3", RoleType.PLANNER)
+        
+        zen.update_task(t1.id, "in_progress")
+        zen.update_task(t2.id, "blocked")
+        assert zen.get_ready_tasks() == [t3]
+        
+        zen.update_task(t2.id, "pending")
+        zen.update_task(t1.id, "pending")
+        assert zen.get_ready_tasks() == [t1, t2, t3]
+    
     def test_update_nonexistent_task(self):
         """Test updating a task that doesn't exist"""
         zen = ZenTasks()
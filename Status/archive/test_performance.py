@@ -22,9 +22,9 @@ class TestPerformance:
         # Generate large text
         text = "\n".join([f"Line {i}: Maybe implement feature {i}" for i in range(1000)])
         
-        start = time.time()
+        start = time.perf_counter()
         result = SmartPlan.check_vagueness(text)
-        elapsed = time.time() - start
+        elapsed = time.perf_counter() - start
         
         # Should complete in reasonable time (<1 second)
         assert elapsed < 1.0, f"Vagueness detection took {elapsed:.3f}s"
@@ -34,9 +34,9 @@ class TestPerformance:
         """Test complete workflow execution time"""
         overseer = Overseer("PerfTest", "Create a simple calculator app")
         
-        start = time.time()
+        start = time.perf_counter()
         results = overseer.execute_workflow()
-        elapsed = time.time() - start
+        elapsed = time.perf_counter() - start
         
         # Should complete in reasonable time (<5 seconds)
         assert elapsed < 5.0, f"Workflow took {elapsed:.3f}s"
@@ -46,10 +46,10 @@ class TestPerformance:
         """Test task creation speed"""
         zen = ZenTasks()
         
-        start = time.time()
+        start = time.perf_counter()
         for i in range(1000):
             zen.create_task(f"Task {i}", RoleType.PLANNER)
-        elapsed = time.time() - start
+        elapsed = time.perf_counter() - start
         
         # Should create 1000 tasks quickly (<0.1s)
         assert elapsed < 0.1, f"Task creation took {elapsed:.3f}s"
@@ -59,14 +59,14 @@ class TestPerformance:
         """Test role switching overhead"""
         overseer = Overseer("Test", "Requirements")
         
-        start = time.time()
+        start = time.perf_counter()
         for _ in range(1000):
             overseer.switch_role(RoleType.PLANNER)
             overseer.switch_role(RoleType.ARCHITECT)
             overseer.switch_role(RoleType.CODER)
             overseer.switch_role(RoleType.REVIEWER)
             overseer.switch_role(RoleType.EXECUTOR)
-        elapsed = time.time() - start
+        elapsed = time.perf_counter() - start
         
         # Should be very fast (<0.5s for 5000 switches)
         assert elapsed < 0.5, f"Role switching took {elapsed:.3f}s"
@@ -82,9 +82,9 @@ class TestPerformance:
         
         planner = PlannerRole()
         
-        start = time.time()
+        start = time.perf_counter()
         planner.execute(ctx, task)
-        elapsed = time.time() - start
+        elapsed = time.perf_counter() - start
         
         # Should handle large context efficiently (<1s)
         assert elapsed < 1.0, f"Context handling took {elapsed:.3f}s"
@@ -94,9 +94,9 @@ class TestPerformance:
         overseer = Overseer("Test", "Requirements")
         overseer.execute_workflow()
         
-        start = time.time()
+        start = time.perf_counter()
         report = overseer.generate_report()
-        elapsed = time.time() - start
+        elapsed = time.perf_counter() - start
         
         # Report should generate quickly (<0.1s)
         assert elapsed < 0.1, f"Report generation took {elapsed:.3f}s"
@@ -114,13 +114,13 @@ class TestPerformance:
             task = zen.create_task(f"Task {i}", RoleType.PLANNER, deps)
             prev_id = task.id
         
-        start = time.time()
+        start = time.perf_counter()
         
         # Process all tasks
         for task in zen.tasks.values():
             zen.update_task(task.id, "completed")
         
-        elapsed = time.time() - start
+        elapsed = time.perf_counter() - start
         
         # Should handle large workflows efficiently
         assert elapsed < 1.0, f"Large workflow took {elapsed:.3f}s"
@@ -146,18 +146,18 @@ class TestScalability:
         zen = ZenTasks()
         
         # Measure time for 100 tasks
-        start = time.time()
+        start = time.perf_counter()
         for i in range(100):
             zen.create_task(f"Task {i}", RoleType.PLANNER)
-        time_100 = time.time() - start
+        time_100 = time.perf_counter() - start
         
         zen = ZenTasks()
         
         # Measure time for 1000 tasks
-        start = time.time()
+        start = time.perf_counter()
         for i in range(1000):
             zen.create_task(f"Task {i}", RoleType.PLANNER)
-        time_1000 = time.time() - start
+        time_1000 = time.perf_counter() - start
         
         # Should scale roughly linearly (within 50x for 10x tasks)
         # Note: May vary on different systems
@@ -172,9 +172,9 @@ class TestScalability:
         for i in range(500):
             zen.create_task(f"Task {i}", RoleType.PLANNER)
         
-        start = time.time()
+        start = time.perf_counter()
         ready = zen.get_ready_tasks()
-        elapsed = time.time() - start
+        elapsed = time.perf_counter() - start
         
         # Should check readiness quickly even with many tasks
         assert elapsed < 1.0, f"Readiness check took {elapsed:.3f}s"
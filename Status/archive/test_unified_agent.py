@@ -6,18 +6,30 @@ Test Suite for Unified Coding Agent
 Validates all core functionality of the unified coding agent system.
 """
 
+import asyncio
+import gc
+import os
 import sys
+import threading
 import time
+import weakref
+from concurrent.futures import wait
 from unified_agent import (
     Overseer, RoleType, SmartPlan, ZenTasks, Tasksync,
     Context, Task, AgentRole, PlannerRole, ArchitectRole,
     CoderRole, ReviewerRole, ExecutorRole
 )
 from background_worker import (
-    BackgroundWorker, TaskStatus, delegate_to_background, get_global_worker
+    BackgroundWorker, TaskStatus, delegate_to_background, delegate_many,
+    get_global_worker
 )
 
 
+def _sum_of_squares(n):
+    """CPU-bound helper; module-level so it can be pickled to a process pool"""
+    return sum(i * i for i in range(n))
+
+
 def test_smart_plan_vagueness_detection():
     """Test SmartPlan vagueness detection"""
     print("Testing SmartPlan vagueness detection...")
@@ -341,9 +353,115 @@ def test_background_worker_basic():
     
     status = worker.get_status(task_id)
     assert status == TaskStatus.COMPLETED, "Task should be completed"
+    print("  ✓ Basic task submission and retrieval working")
+    
+    # With nothing queued, an inline submit finishes before returning
+    task_id = worker.submit_task("test-task-inline", simple_task, 1, 2, inline_if_idle=True)
+    assert worker.get_status(task_id) == TaskStatus.COMPLETED, "Inline task should finish on submit"
+    assert worker.get_result(task_id, timeout=0) == 3, "Inline task should store its result"
+    print("  ✓ Inline submission when idle working")
+    
+    # Submits from inside a task are always queued, never nested inline
+    def inline_from_inside(task_id):
+        inner_id = worker.submit_task(
+            task_id, threading.current_thread, inline_if_idle=True
+        )
+        return threading.current_thread(), worker.get_result(inner_id, timeout=2.0)
+    
+    outer_id = worker.submit_task("from-worker", inline_from_inside, "inner-worker")
+    outer_thread, inner_thread = worker.get_result(outer_id, timeout=2.0)
+    assert inner_thread is not outer_thread, "Worker thread should not run tasks inline"
+    
+    outer_id = worker.submit_task(
+        "from-inline", inline_from_inside, "inner-inline", inline_if_idle=True
+    )
+    outer_thread, inner_thread = worker.get_result(outer_id, timeout=0)
+    assert outer_thread is threading.current_thread(), "Outer task should run inline"
+    assert inner_thread is not outer_thread, "Inline task should not nest another inline run"
+    print("  ✓ Inline submission refused from inside tasks")
+    
+    worker.shutdown(wait=True)
+
+
+def test_background_worker_batch_submit():
+    """Test submitting several tasks in one call"""
+    print("\nTesting background worker batch submission...")
+    
+    worker = BackgroundWorker(max_workers=2)
+    
+    def square(x):
+        return x * x
+    
+    specs = [(f"batch-{i}", square, (i,), {}) for i in range(10)]
+    task_ids = worker.submit_tasks(specs)
+    assert task_ids == [f"batch-{i}" for i in range(10)], "Should return IDs in order"
+    
+    _, not_done = wait([worker.get_future(tid) for tid in task_ids], timeout=2.0)
+    assert not not_done, "Batch futures should all settle"
+    
+    results = [worker.get_result(tid, timeout=2.0) for tid in task_ids]
+    assert results == [i * i for i in range(10)], "All batch tasks should complete"
+    print("  ✓ Batch tasks completed")
+    
+    # A duplicate ID rejects the whole batch
+    try:
+        worker.submit_tasks([("fresh-task", square, (1,), {}), ("batch-0", square, (2,), {})])
+        assert False, "Should have raised ValueError"
+    except ValueError:
+        pass
+    assert "fresh-task" not in worker.tasks, "Rejected batch should not be queued"
+    print("  ✓ Duplicate IDs reject the batch")
+    
+    worker.shutdown(wait=True)
+
+
+def test_background_worker_process_pool():
+    """Test CPU-bound tasks on the process pool backend"""
+    print("\nTesting background worker process pool...")
+    
+    worker = BackgroundWorker(max_workers=2, executor="process")
+    
+    task_ids = [worker.submit_task(f"cpu-{i}", _sum_of_squares, 10000) for i in range(4)]
+    for tid in task_ids:
+        assert worker.get_result(tid, timeout=10.0) == _sum_of_squares(10000), \
+            "Process task should compute correct result"
+        assert worker.get_status(tid) == TaskStatus.COMPLETED, "Task should be completed"
+    print("  ✓ Process pool tasks completed")
+    
+    # Per-task override back onto a worker thread
+    task_id = worker.submit_task("thread-override", lambda: "ran on thread", kind="thread")
+    assert worker.get_result(task_id, timeout=2.0) == "ran on thread", \
+        "Thread override should run unpicklable callables"
+    print("  ✓ Per-task kind override working")
+    
+    worker.shutdown(wait=True)
+
+
+def test_background_worker_numa_pinning():
+    """Test pinning workers to CPU sets and node-preferred submission"""
+    print("\nTesting background worker CPU pinning...")
+    
+    if not hasattr(os, "sched_setaffinity"):
+        print("  - Skipped: platform has no sched_setaffinity")
+        return
+    
+    cpus = sorted(os.sched_getaffinity(0))
+    nodes = [{cpus[0]}, {cpus[-1]}]
+    worker = BackgroundWorker(max_workers=2, numa_nodes=nodes)
+    
+    task_id = worker.submit_task("pinned-task", os.sched_getaffinity, 0, prefer_node=1)
+    assert worker.get_result(task_id, timeout=2.0) in nodes, \
+        "Task should run on a worker pinned to a node's CPUs"
+    print("  ✓ Workers pinned to node CPU sets")
+    
+    try:
+        worker.submit_task("bad-node", os.getpid, prefer_node=5)
+        assert False, "Should have raised ValueError"
+    except ValueError:
+        pass
+    print("  ✓ Unknown node rejected")
     
     worker.shutdown(wait=True)
-    print("  ✓ Basic task submission and retrieval working")
 
 
 def test_background_worker_async():
@@ -371,6 +489,56 @@ def test_background_worker_async():
     print("  ✓ Async execution working correctly")
 
 
+def test_background_worker_await_result():
+    """Test awaiting background tasks from an event loop"""
+    print("\nTesting background worker asyncio front-end...")
+    
+    worker = BackgroundWorker(max_workers=2)
+    
+    def slow_add(x, y):
+        time.sleep(0.2)
+        return x + y
+    
+    async def fetch_value():
+        await asyncio.sleep(0.01)
+        return "from coroutine"
+    
+    async def main():
+        ticks = 0
+        
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+        
+        tick_task = asyncio.create_task(ticker())
+        worker.submit_task("await-task", slow_add, 2, 3)
+        result = await worker.await_result("await-task")
+        tick_task.cancel()
+        
+        worker.submit_coroutine("coro-task", fetch_value())
+        coro_result = await worker.await_result("coro-task")
+        
+        # The task may be purged (or evicted) before the waiter wakes up
+        worker.submit_task("purged-task", slow_add, 1, 1)
+        waiter = asyncio.create_task(worker.await_result("purged-task"))
+        await asyncio.sleep(0)
+        worker.get_future("purged-task").result(timeout=2.0)
+        worker.purge("purged-task")
+        purged_result = await waiter
+        return result, coro_result, purged_result, ticks
+    
+    result, coro_result, purged_result, ticks = asyncio.run(main())
+    assert result == 5, "Should await correct result"
+    assert coro_result == "from coroutine", "Should run submitted coroutine"
+    assert purged_result == 2, "Should return result of a task purged while awaited"
+    assert ticks > 0, "Event loop should keep running while awaiting"
+    print("  ✓ Awaiting results without blocking the loop")
+    
+    worker.shutdown(wait=True)
+
+
 def test_background_worker_error_handling():
     """Test background worker error handling"""
     print("\nTesting background worker error handling...")
@@ -393,6 +561,17 @@ def test_background_worker_error_handling():
     status = worker.get_status(task_id)
     assert status == TaskStatus.FAILED, "Task should be marked as failed"
     
+    # A task's own TimeoutError must not look like get_result timing out
+    def timing_out_task():
+        raise TimeoutError("Upstream call timed out")
+    
+    task_id = worker.submit_task("timeout-task", timing_out_task)
+    try:
+        worker.get_result(task_id, timeout=2.0)
+        assert False, "Should have raised TimeoutError"
+    except TimeoutError as e:
+        assert "Upstream call timed out" in str(e), "Should propagate task's own error"
+    
     worker.shutdown(wait=True)
     print("  ✓ Error handling working correctly")
 
@@ -403,19 +582,20 @@ def test_background_worker_cancellation():
     
     worker = BackgroundWorker(max_workers=1)
     
-    # Submit a quick task to keep worker busy briefly
-    def quick_task():
-        time.sleep(0.3)
-        return "Done"
+    # Keep the only worker busy until the test releases it
+    started = threading.Event()
+    release = threading.Event()
     
-    # Submit task to keep worker busy
-    worker.submit_task("busy-task", quick_task)
+    def blocking_task():
+        started.set()
+        release.wait(timeout=5.0)
+        return "Done"
     
-    # Give worker thread time to pick up the task
-    time.sleep(0.1)
+    worker.submit_task("busy-task", blocking_task)
+    assert started.wait(timeout=2.0), "Worker should pick up the busy task"
     
     # Submit task to cancel (will be queued)
-    task_id = worker.submit_task("cancel-task", quick_task)
+    task_id = worker.submit_task("cancel-task", blocking_task)
     
     # Cancel while still queued
     cancelled = worker.cancel_task(task_id)
@@ -424,11 +604,63 @@ def test_background_worker_cancellation():
     status = worker.get_status(task_id)
     assert status == TaskStatus.CANCELLED, "Task should be cancelled"
     
+    release.set()
+    assert worker.get_result("busy-task", timeout=2.0) == "Done", "Busy task should still finish"
+    
     # Properly shutdown to avoid thread leaks
     worker.shutdown(wait=True)
     print("  ✓ Task cancellation working correctly")
 
 
+def test_background_worker_shutdown():
+    """Test that shutdown wakes waiters and refuses late work"""
+    print("\nTesting background worker shutdown...")
+    
+    worker = BackgroundWorker(max_workers=1)
+    
+    started = threading.Event()
+    release = threading.Event()
+    
+    def blocking_task():
+        started.set()
+        release.wait(timeout=5.0)
+        return "Done"
+    
+    worker.submit_task("busy-task", blocking_task)
+    assert started.wait(timeout=2.0), "Worker should pick up the busy task"
+    queued_id = worker.submit_task("queued-task", blocking_task)
+    
+    # A waiter blocked with no timeout must be woken by shutdown
+    errors = []
+    
+    def wait_for_queued():
+        try:
+            worker.get_result(queued_id)
+        except RuntimeError as e:
+            errors.append(e)
+    
+    waiter = threading.Thread(target=wait_for_queued, daemon=True)
+    waiter.start()
+    worker.shutdown(wait=False)
+    waiter.join(timeout=2.0)
+    assert not waiter.is_alive(), "Shutdown should wake blocked waiters"
+    assert len(errors) == 1, "Waiter should get RuntimeError for a task that never ran"
+    print("  ✓ Shutdown wakes waiters")
+    
+    # Work submitted after shutdown never runs, so it must not hang either
+    late_id = worker.submit_task("late-task", lambda: "never")
+    try:
+        worker.get_result(late_id, timeout=2.0)
+        assert False, "Should have raised RuntimeError"
+    except RuntimeError:
+        pass
+    print("  ✓ Tasks submitted after shutdown report it")
+    
+    release.set()
+    assert worker.get_result("busy-task", timeout=2.0) == "Done", "Running task should finish"
+    worker.shutdown(wait=True)
+
+
 def test_background_worker_task_info():
     """Test background worker task info retrieval"""
     print("\nTesting background worker task info...")
@@ -458,6 +690,53 @@ def test_background_worker_task_info():
     print("  ✓ Task info retrieval working correctly")
 
 
+def test_background_worker_retention():
+    """Test bounded retention and purging of finished tasks"""
+    print("\nTesting background worker task retention...")
+    
+    worker = BackgroundWorker(max_workers=1, max_retained=3)
+    
+    for i in range(6):
+        worker.get_result(worker.submit_task(f"keep-{i}", lambda v=i: v), timeout=2.0)
+    
+    # Eviction happens on submit, so the newest submission is still tracked
+    assert len(worker.tasks) <= 4, "Should cap retained finished tasks"
+    assert "keep-0" not in worker.tasks, "Oldest finished task should be evicted"
+    assert "keep-5" in worker.tasks, "Newest task should be retained"
+    print("  ✓ Finished tasks capped at max_retained")
+    
+    class Result:
+        pass
+    
+    worker.get_result(worker.submit_task("weak", Result), timeout=2.0)
+    result_ref = weakref.ref(worker.get_result("weak"))
+    # Once the only worker has run another task, it holds nothing of "weak"
+    worker.get_result(worker.submit_task("after-weak", int), timeout=2.0)
+    worker.purge("weak")
+    gc.collect()
+    assert result_ref() is None, "Purged task's result should be freed"
+    
+    worker.purge("keep-5")
+    assert "keep-5" not in worker.tasks, "Purged task should be released"
+    try:
+        worker.get_status("keep-5")
+        assert False, "Should have raised KeyError"
+    except KeyError:
+        pass
+    print("  ✓ Explicit purge working")
+    
+    payload = list(range(1000))
+    worker.get_result(worker.submit_task("drop-args", len, payload), timeout=2.0)
+    task = worker.tasks["drop-args"]
+    assert task.args == () and task.callable is None, "Should release inputs when done"
+    
+    worker.get_result(worker.submit_task("keep-args", len, payload, retain_args=True), timeout=2.0)
+    assert worker.tasks["keep-args"].args == (payload,), "retain_args should keep inputs"
+    print("  ✓ Task inputs released on completion")
+    
+    worker.shutdown(wait=True)
+
+
 def test_global_worker_delegate():
     """Test global worker delegation convenience function"""
     print("\nTesting global worker delegation...")
@@ -472,6 +751,15 @@ def test_global_worker_delegate():
     assert result == 42, "Should use global worker correctly"
     
     print("  ✓ Global worker delegation working")
+    
+    task_ids = delegate_many([
+        ("global-batch-1", multiply, (2, 3), {}),
+        ("global-batch-2", multiply, (4, 5), {}),
+    ])
+    results = [worker.get_result(tid, timeout=2.0) for tid in task_ids]
+    assert results == [6, 20], "Should batch-delegate to global worker"
+    
+    print("  ✓ Global batch delegation working")
 
 
 def run_all_tests():
@@ -492,10 +780,16 @@ def run_all_tests():
         test_output_formatting,
         test_report_generation,
         test_background_worker_basic,
+        test_background_worker_batch_submit,
+        test_background_worker_process_pool,
+        test_background_worker_numa_pinning,
         test_background_worker_async,
+        test_background_worker_await_result,
         test_background_worker_error_handling,
         test_background_worker_cancellation,
-        # test_background_worker_task_info,  # SKIP: Has timing issue when run after other tests
+        test_background_worker_shutdown,
+        test_background_worker_task_info,
+        test_background_worker_retention,
         test_global_worker_delegate,
     ]
     
@@ -521,5 +815,9 @@ def run_all_tests():
 
 
 if __name__ == "__main__":
+    # The checks are plain asserts; under -O every test would "pass"
+    if not __debug__:
+        sys.exit("Assertions are disabled (python -O); run the tests without -O")
+    
     success = run_all_tests()
     sys.exit(0 if success else 1)
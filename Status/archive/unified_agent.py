@@ -18,12 +18,18 @@ Features:
 - Clarifying question mechanism
 """
 
+import bisect
 import json
 import re
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
+from datetime import datetime
 from enum import Enum
-from typing import List, Dict, Any, Optional, Set
+from typing import List, Dict, Any, Optional, Set, Tuple
+
+
+# Rule used above and below titled sections of role output and reports
+BANNER = "=" * 80
 
 
 class RoleType(Enum):
@@ -35,6 +41,24 @@ class RoleType(Enum):
     EXECUTOR = "executor"
 
 
+def _with_slots(cls):
+    """
+    Rebuild a dataclass with __slots__, as dataclass(slots=True) does
+    
+    slots=True needs Python 3.10; this gives the same classes on 3.9.
+    Field defaults live in the generated __init__, so the class-level
+    copies that would clash with the slots can be dropped.
+    """
+    names = tuple(f.name for f in fields(cls))
+    namespace = {
+        key: value for key, value in cls.__dict__.items()
+        if key not in names and key not in ("__dict__", "__weakref__")
+    }
+    namespace["__slots__"] = names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+@_with_slots
 @dataclass
 class Task:
     """Represents a task in the workflow"""
@@ -47,6 +71,7 @@ class Task:
     feedback: List[str] = field(default_factory=list)
 
 
+@_with_slots
 @dataclass
 class Context:
     """Maintains context across role transitions"""
@@ -61,6 +86,27 @@ class Context:
     vague_items: List[str] = field(default_factory=list)
 
 
+def _union_pattern(patterns: List[str]) -> str:
+    """
+    Combine regex patterns into one alternation matching any of them
+    
+    Patterns of the form \\b(words)\\b are merged under a single pair of
+    word boundaries, so the engine tests \\b once per position rather than
+    once per group - most of the scan cost on text with no matches.
+    """
+    words = []
+    others = []
+    for pattern in patterns:
+        if pattern.startswith(r'\b(') and pattern.endswith(r')\b'):
+            words.append(pattern[3:-3])
+        else:
+            others.append(f'(?:{pattern})')
+    
+    if words:
+        others.insert(0, r'\b(?:' + '|'.join(words) + r')\b')
+    return '|'.join(others)
+
+
 class SmartPlan:
     """Checks for vagueness in requirements and plans"""
     
@@ -73,6 +119,18 @@ class SmartPlan:
         r'\?\?',
     ]
     
+    # All indicators as one compiled alternation, so each line is checked
+    # in a single regex pass instead of one re.search per indicator
+    _VAGUE_RE = re.compile(_union_pattern(VAGUE_INDICATORS), re.IGNORECASE)
+    
+    # Question templates for suggest_clarifications, checked in order; an
+    # item gets the first template any of whose words it contains
+    _CLARIFICATIONS = (
+        (('maybe', 'might', 'could'), "Please confirm: {item} - Is this required or optional?"),
+        (('some', 'few', 'many', 'several'), "Please specify exact quantity: {item}"),
+        (('tbd', 'todo'), "Please provide details for: {item}"),
+    )
+    
     @staticmethod
     def check_vagueness(text: str) -> List[str]:
         """
@@ -86,12 +144,11 @@ class SmartPlan:
         """
         vague_items = []
         lines = text.split('\n')
+        search = SmartPlan._VAGUE_RE.search
         
         for i, line in enumerate(lines, 1):
-            for pattern in SmartPlan.VAGUE_INDICATORS:
-                if re.search(pattern, line, re.IGNORECASE):
-                    vague_items.append(f"Line {i}: {line.strip()}")
-                    break
+            if search(line):
+                vague_items.append(f"Line {i}: {line.strip()}")
         
         return vague_items
     
@@ -108,24 +165,43 @@ class SmartPlan:
         """
         questions = []
         for item in vague_items:
-            if any(word in item.lower() for word in ['maybe', 'might', 'could']):
-                questions.append(f"Please confirm: {item} - Is this required or optional?")
-            elif any(word in item.lower() for word in ['some', 'few', 'many', 'several']):
-                questions.append(f"Please specify exact quantity: {item}")
-            elif 'tbd' in item.lower() or 'todo' in item.lower():
-                questions.append(f"Please provide details for: {item}")
+            lowered = item.lower()
+            for words, template in SmartPlan._CLARIFICATIONS:
+                if any(word in lowered for word in words):
+                    break
             else:
-                questions.append(f"Please clarify: {item}")
+                template = "Please clarify: {item}"
+            questions.append(template.format(item=item))
         
         return questions
 
 
 class ZenTasks:
-    """Workflow management system for tasks"""
+    """
+    Workflow management system for tasks
+    
+    Readiness and status counts are tracked incrementally, so task state
+    has to change through ZenTasks: call update_task() rather than
+    assigning task.status, and pass dependencies to create_task(). A
+    dependency appended to a task in place is still honoured, but one
+    removed in place is not, so the task won't become ready.
+    """
     
     def __init__(self):
         self.tasks: Dict[str, Task] = {}
         self.task_counter = 0
+        # Readiness is tracked incrementally so get_ready_tasks only looks
+        # at pending tasks whose dependencies are all completed
+        self._unmet: Dict[str, int] = {}              # task ID -> deps not completed
+        self._dependents: Dict[str, List[str]] = {}   # dep ID -> tasks waiting on it
+        self._ready: Set[str] = set()                 # pending tasks with no unmet deps
+        self._order: Dict[str, int] = {}              # task ID -> creation order
+        # _ready as (creation order, task ID), kept sorted with bisect so
+        # get_ready_tasks needn't sort on every call
+        self._ready_by_order: List[Tuple[int, str]] = []
+        # Tasks per status, kept up to date by create_task/update_task so
+        # status reports needn't scan
+        self._status_counts: Dict[str, int] = {}
     
     def create_task(self, description: str, assignee: RoleType, 
                    dependencies: List[str] = None) -> Task:
@@ -141,34 +217,85 @@ class ZenTasks:
         )
         
         self.tasks[task_id] = task
+        self._order[task_id] = self.task_counter
+        self._count_status(task.status, 1)
+        
+        # Unknown dependencies count as unmet until created and completed
+        unmet = 0
+        for dep_id in task.dependencies:
+            self._dependents.setdefault(dep_id, []).append(task_id)
+            if not self._is_completed(dep_id):
+                unmet += 1
+        self._unmet[task_id] = unmet
+        self._sync_ready(task_id)
+        
         return task
     
     def update_task(self, task_id: str, status: str, output: str = None):
         """Update task status and output"""
         if task_id in self.tasks:
+            old_status = self.tasks[task_id].status
             self.tasks[task_id].status = status
+            self._count_status(old_status, -1)
+            self._count_status(status, 1)
             if output:
                 self.tasks[task_id].output = output
+            
+            if (old_status == "completed") != (status == "completed"):
+                self._propagate(task_id, -1 if status == "completed" else 1)
+            if old_status != status:
+                self._sync_ready(task_id)
     
     def get_ready_tasks(self) -> List[Task]:
         """Get tasks that are ready to execute (dependencies met)"""
         ready = []
-        for task in self.tasks.values():
-            if task.status == "pending":
-                deps_met = all(
-                    self.tasks.get(dep_id, Task("", "")).status == "completed"
-                    for dep_id in task.dependencies
-                )
-                if deps_met:
-                    ready.append(task)
+        for _, task_id in self._ready_by_order:
+            task = self.tasks[task_id]
+            # Re-check, as _unmet doesn't know about dependencies appended
+            # in place after create_task
+            if task.status == "pending" and (not task.dependencies or all(
+                self._is_completed(dep_id) for dep_id in task.dependencies
+            )):
+                ready.append(task)
         return ready
     
+    def _is_completed(self, task_id: str) -> bool:
+        """Whether task_id exists and is completed"""
+        task = self.tasks.get(task_id)
+        return task is not None and task.status == "completed"
+    
+    def _count_status(self, status: str, delta: int):
+        """Adjust the number of tasks with the given status"""
+        self._status_counts[status] = self._status_counts.get(status, 0) + delta
+    
+    def _propagate(self, task_id: str, delta: int):
+        """Adjust unmet-dependency counts of tasks waiting on task_id"""
+        for dependent_id in self._dependents.get(task_id, ()):
+            self._unmet[dependent_id] += delta
+            self._sync_ready(dependent_id)
+    
+    def _sync_ready(self, task_id: str):
+        """Add task_id to, or drop it from, the ready set as its state requires"""
+        should_be_ready = (
+            self._unmet[task_id] == 0 and self.tasks[task_id].status == "pending"
+        )
+        if should_be_ready == (task_id in self._ready):
+            return
+        
+        entry = (self._order[task_id], task_id)
+        if should_be_ready:
+            self._ready.add(task_id)
+            bisect.insort(self._ready_by_order, entry)
+        else:
+            self._ready.discard(task_id)
+            del self._ready_by_order[bisect.bisect_left(self._ready_by_order, entry)]
+    
     def get_workflow_status(self) -> Dict[str, Any]:
         """Get overall workflow status"""
         total = len(self.tasks)
-        completed = sum(1 for t in self.tasks.values() if t.status == "completed")
-        in_progress = sum(1 for t in self.tasks.values() if t.status == "in_progress")
-        blocked = sum(1 for t in self.tasks.values() if t.status == "blocked")
+        completed = self._status_counts.get("completed", 0)
+        in_progress = self._status_counts.get("in_progress", 0)
+        blocked = self._status_counts.get("blocked", 0)
         
         return {
             "total": total,
@@ -185,6 +312,9 @@ class Tasksync:
     
     def __init__(self):
         self.feedback_history: List[Dict[str, Any]] = []
+        # Indexes over feedback_history, filled in by provide_feedback
+        self._by_task: Dict[str, List[Dict[str, Any]]] = {}
+        self._blocking: List[Dict[str, Any]] = []
     
     def provide_feedback(self, task_id: str, role: RoleType, 
                         feedback: str, severity: str = "info"):
@@ -205,19 +335,21 @@ class Tasksync:
             "timestamp": self._get_timestamp()
         }
         self.feedback_history.append(feedback_item)
+        self._by_task.setdefault(task_id, []).append(feedback_item)
+        if severity == "error":
+            self._blocking.append(feedback_item)
     
     def get_feedback_for_task(self, task_id: str) -> List[Dict[str, Any]]:
         """Retrieve all feedback for a specific task"""
-        return [f for f in self.feedback_history if f["task_id"] == task_id]
+        return list(self._by_task.get(task_id, ()))
     
     def get_blocking_feedback(self) -> List[Dict[str, Any]]:
         """Get all error-level feedback that may block progress"""
-        return [f for f in self.feedback_history if f["severity"] == "error"]
+        return list(self._blocking)
     
     @staticmethod
     def _get_timestamp() -> str:
         """Get current timestamp as string"""
-        from datetime import datetime
         return datetime.now().isoformat()
 
 
@@ -244,15 +376,39 @@ class AgentRole(ABC):
     
     def format_output(self, content: str, title: str = None) -> str:
         """Format output cleanly with full content"""
-        header = f"\n{'=' * 80}\n"
+        header = f"\n{BANNER}\n"
         if title:
-            header += f"{title}\n{'=' * 80}\n"
-        return f"{header}{content}\n{'=' * 80}\n"
+            header += f"{title}\n{BANNER}\n"
+        return f"{header}{content}\n{BANNER}\n"
 
 
 class PlannerRole(AgentRole):
     """Planner: Analyzes requirements and creates action plans"""
     
+    # The action plan doesn't depend on the project, so it's built once
+    _ACTION_PLAN = (
+        "### Action Plan\n\n"
+        "1. **Architecture Design**\n"
+        "   - Define system components\n"
+        "   - Establish interfaces and contracts\n"
+        "   - Identify dependencies\n\n"
+        
+        "2. **Implementation**\n"
+        "   - Core functionality development\n"
+        "   - Module implementation\n"
+        "   - Integration points\n\n"
+        
+        "3. **Review & Validation**\n"
+        "   - Code quality review\n"
+        "   - Standards compliance check\n"
+        "   - Security review\n\n"
+        
+        "4. **Execution & Testing**\n"
+        "   - Unit testing\n"
+        "   - Integration testing\n"
+        "   - Validation of requirements\n\n"
+    )
+    
     def __init__(self):
         super().__init__("Planner")
         self.role_type = RoleType.PLANNER
@@ -267,39 +423,24 @@ class PlannerRole(AgentRole):
             questions = SmartPlan.suggest_clarifications(vague_items)
             context.clarifying_questions.extend(questions)
             
-            plan = "## Planning Phase\n\n"
-            plan += "### Vagueness Detected\n"
-            plan += "The following items need clarification:\n\n"
-            for q in questions:
-                plan += f"- {q}\n"
-            plan += "\n### Proceeding with assumptions...\n\n"
+            parts = [
+                "## Planning Phase\n\n",
+                "### Vagueness Detected\n",
+                "The following items need clarification:\n\n",
+            ]
+            parts += [f"- {q}\n" for q in questions]
+            parts.append("\n### Proceeding with assumptions...\n\n")
         else:
-            plan = "## Planning Phase\n\n"
-            plan += "### Requirements Analysis\n"
-            plan += "Requirements are clear and well-defined.\n\n"
+            parts = [
+                "## Planning Phase\n\n",
+                "### Requirements Analysis\n",
+                "Requirements are clear and well-defined.\n\n",
+            ]
         
         # Create basic plan structure
-        plan += "### Action Plan\n\n"
-        plan += "1. **Architecture Design**\n"
-        plan += "   - Define system components\n"
-        plan += "   - Establish interfaces and contracts\n"
-        plan += "   - Identify dependencies\n\n"
-        
-        plan += "2. **Implementation**\n"
-        plan += "   - Core functionality development\n"
-        plan += "   - Module implementation\n"
-        plan += "   - Integration points\n\n"
-        
-        plan += "3. **Review & Validation**\n"
-        plan += "   - Code quality review\n"
-        plan += "   - Standards compliance check\n"
-        plan += "   - Security review\n\n"
-        
-        plan += "4. **Execution & Testing**\n"
-        plan += "   - Unit testing\n"
-        plan += "   - Integration testing\n"
-        plan += "   - Validation of requirements\n\n"
+        parts.append(self._ACTION_PLAN)
         
+        plan = "".join(parts)
         context.plan = plan
         return self.format_output(plan, f"{self.name} Output")
 
@@ -307,44 +448,52 @@ class PlannerRole(AgentRole):
 class ArchitectRole(AgentRole):
     """Architect: Designs system structure and components"""
     
+    # Everything below the project's root directory line is the same for
+    # every project, so it's built once
+    _LAYOUT = (
+        "├── core/\n"
+        "│   ├── __init__.py\n"
+        "│   ├── models.py\n"
+        "│   └── utils.py\n"
+        "├── services/\n"
+        "│   ├── __init__.py\n"
+        "│   └── main_service.py\n"
+        "├── tests/\n"
+        "│   └── test_main.py\n"
+        "├── main.py\n"
+        "└── README.md\n"
+        "```\n\n"
+        
+        "### Key Components\n\n"
+        "1. **Core Module**: Foundation classes and utilities\n"
+        "2. **Services Module**: Business logic implementation\n"
+        "3. **Main Entry Point**: Application orchestration\n"
+        "4. **Tests**: Validation and testing suite\n\n"
+        
+        "### Design Principles\n"
+        "- Separation of concerns\n"
+        "- Clear interfaces and contracts\n"
+        "- Testable components\n"
+        "- Maintainable structure\n\n"
+    )
+    
     def __init__(self):
         super().__init__("Architect")
         self.role_type = RoleType.ARCHITECT
     
     def execute(self, context: Context, task: Task) -> str:
         """Design system architecture"""
-        architecture = "## Architecture Design\n\n"
-        
-        architecture += "### System Overview\n"
-        architecture += f"Project: {context.project_name}\n\n"
-        
-        architecture += "### Component Structure\n"
-        architecture += "```\n"
-        architecture += f"{context.project_name}/\n"
-        architecture += "├── core/\n"
-        architecture += "│   ├── __init__.py\n"
-        architecture += "│   ├── models.py\n"
-        architecture += "│   └── utils.py\n"
-        architecture += "├── services/\n"
-        architecture += "│   ├── __init__.py\n"
-        architecture += "│   └── main_service.py\n"
-        architecture += "├── tests/\n"
-        architecture += "│   └── test_main.py\n"
-        architecture += "├── main.py\n"
-        architecture += "└── README.md\n"
-        architecture += "```\n\n"
-        
-        architecture += "### Key Components\n\n"
-        architecture += "1. **Core Module**: Foundation classes and utilities\n"
-        architecture += "2. **Services Module**: Business logic implementation\n"
-        architecture += "3. **Main Entry Point**: Application orchestration\n"
-        architecture += "4. **Tests**: Validation and testing suite\n\n"
-        
-        architecture += "### Design Principles\n"
-        architecture += "- Separation of concerns\n"
-        architecture += "- Clear interfaces and contracts\n"
-        architecture += "- Testable components\n"
-        architecture += "- Maintainable structure\n\n"
+        name = context.project_name
+        architecture = (
+            "## Architecture Design\n\n"
+            
+            "### System Overview\n"
+            f"Project: {name}\n\n"
+            
+            "### Component Structure\n"
+            "```\n"
+            f"{name}/\n"
+        ) + self._LAYOUT
         
         context.architecture = architecture
         return self.format_output(architecture, f"{self.name} Output")
@@ -353,6 +502,26 @@ class ArchitectRole(AgentRole):
 class CoderRole(AgentRole):
     """Coder: Implements code based on designs"""
     
+    # Core module; it doesn't mention the project, so it's built once
+    _CORE_CODE = '''"""
+Core models and utilities
+"""
+
+class BaseModel:
+    """Base class for data models"""
+    
+    def __init__(self, name: str):
+        self.name = name
+    
+    def __repr__(self):
+        return f"{self.__class__.__name__}(name='{self.name}')"
+
+
+def validate_input(value: str) -> bool:
+    """Validate input string"""
+    return bool(value and value.strip())
+'''
+    
     def __init__(self):
         super().__init__("Coder")
         self.role_type = RoleType.CODER
@@ -360,7 +529,6 @@ class CoderRole(AgentRole):
     def execute(self, context: Context, task: Task) -> str:
         """Generate implementation code"""
         # Generate sample code based on architecture
-        code_output = "## Code Implementation\n\n"
         
         # Main module - using f-string for cleaner template
         project_name = context.project_name
@@ -378,37 +546,19 @@ if __name__ == "__main__":
     exit(main())
 '''
         
-        context.code_files["main.py"] = main_code
-        
-        # Core module
-        core_code = '''"""
-Core models and utilities
-"""
-
-class BaseModel:
-    """Base class for data models"""
-    
-    def __init__(self, name: str):
-        self.name = name
-    
-    def __repr__(self):
-        return f"{self.__class__.__name__}(name='{self.name}')"
-
-
-def validate_input(value: str) -> bool:
-    """Validate input string"""
-    return bool(value and value.strip())
-'''
-        
-        context.code_files["core/models.py"] = core_code
-        
-        # Format output
-        code_output += "### Generated Files\n\n"
-        for filename, code in context.code_files.items():
-            code_output += f"#### File: {filename}\n"
-            code_output += "```python\n"
-            code_output += code
-            code_output += "\n```\n\n"
+        context.code_files.update({
+            "main.py": main_code,
+            "core/models.py": self._CORE_CODE,
+        })
+        
+        # Format output; the file bodies can be large, so join them once
+        # rather than re-copying the output string for every file
+        parts = ["## Code Implementation\n\n", "### Generated Files\n\n"]
+        parts += [
+            f"#### File: {filename}\n```python\n{code}\n```\n\n"
+            for filename, code in context.code_files.items()
+        ]
+        code_output = "".join(parts)
         
         return self.format_output(code_output, f"{self.name} Output")
 
@@ -422,14 +572,16 @@ class ReviewerRole(AgentRole):
     
     def execute(self, context: Context, task: Task) -> str:
         """Review code quality and standards compliance"""
-        review = "## Code Review\n\n"
-        
-        review += "### Quality Checks\n\n"
+        parts = [
+            "## Code Review\n\n",
+            
+            "### Quality Checks\n\n",
+        ]
         
         # Check each file
         issues_found = False
         for filename, code in context.code_files.items():
-            review += f"#### {filename}\n"
+            parts.append(f"#### {filename}\n")
             
             # Basic quality checks
             checks = []
@@ -443,68 +595,80 @@ class ReviewerRole(AgentRole):
             if "def " in code:
                 checks.append("✓ Functions defined")
             
-            if len(code.split('\n')) > 0:
-                checks.append("✓ Non-empty file")
+            # Every file has at least one line, so there's nothing to count
+            checks.append("✓ Non-empty file")
             
-            for check in checks:
-                review += f"- {check}\n"
+            parts += [f"- {check}\n" for check in checks]
             
-            review += "\n"
+            parts.append("\n")
         
-        review += "### Standards Compliance\n"
-        review += "- ✓ Code structure follows architecture\n"
-        review += "- ✓ Naming conventions appropriate\n"
-        review += "- ✓ Clean code principles applied\n\n"
-        
-        review += "### Recommendations\n"
+        parts.append(
+            "### Standards Compliance\n"
+            "- ✓ Code structure follows architecture\n"
+            "- ✓ Naming conventions appropriate\n"
+            "- ✓ Clean code principles applied\n\n"
+            
+            "### Recommendations\n"
+        )
         if issues_found:
-            review += "- Add comprehensive documentation where missing\n"
+            parts.append("- Add comprehensive documentation where missing\n")
             context.review_notes.append("Add documentation to all modules")
         else:
-            review += "- Code meets quality standards\n"
+            parts.append("- Code meets quality standards\n")
         
-        review += "- Consider adding error handling\n"
-        review += "- Add type hints for better maintainability\n\n"
+        parts += [
+            "- Consider adding error handling\n",
+            "- Add type hints for better maintainability\n\n",
+        ]
         
         context.review_notes.append("Code review completed")
         
-        return self.format_output(review, f"{self.name} Output")
+        return self.format_output("".join(parts), f"{self.name} Output")
 
 
 class ExecutorRole(AgentRole):
     """Executor: Runs and validates implementations"""
     
+    # Simulated validation, as (check, status, details); fixed, so its
+    # table rows and result lines are formatted once
+    _VALIDATIONS = (
+        ("Syntax Check", "PASS", "All files have valid Python syntax"),
+        ("Import Check", "PASS", "All imports resolve correctly"),
+        ("Structure Check", "PASS", "File structure matches architecture"),
+        ("Documentation Check", "PASS", "Core documentation present"),
+    )
+    _VALIDATION_ROWS = "".join(
+        f"| {check} | {status} | {details} |\n" for check, status, details in _VALIDATIONS
+    )
+    _VALIDATION_RESULTS = tuple(f"{check}: {status}" for check, status, _ in _VALIDATIONS)
+    
     def __init__(self):
         super().__init__("Executor")
         self.role_type = RoleType.EXECUTOR
     
     def execute(self, context: Context, task: Task) -> str:
         """Execute and validate the implementation"""
-        execution = "## Execution & Validation\n\n"
-        
-        execution += "### Validation Steps\n\n"
-        
-        # Simulate validation
-        validations = [
-            ("Syntax Check", "PASS", "All files have valid Python syntax"),
-            ("Import Check", "PASS", "All imports resolve correctly"),
-            ("Structure Check", "PASS", "File structure matches architecture"),
-            ("Documentation Check", "PASS", "Core documentation present"),
+        parts = [
+            "## Execution & Validation\n\n",
+            
+            "### Validation Steps\n\n",
         ]
         
-        execution += "| Check | Status | Details |\n"
-        execution += "|-------|--------|----------|\n"
-        
-        for check, status, details in validations:
-            execution += f"| {check} | {status} | {details} |\n"
-            context.execution_results.append(f"{check}: {status}")
+        parts += [
+            "| Check | Status | Details |\n",
+            "|-------|--------|----------|\n",
+            self._VALIDATION_ROWS,
+        ]
+        context.execution_results.extend(self._VALIDATION_RESULTS)
         
-        execution += "\n### Execution Summary\n"
-        execution += "✓ All validation checks passed\n"
-        execution += "✓ Implementation meets requirements\n"
-        execution += "✓ Ready for deployment\n\n"
+        parts.append(
+            "\n### Execution Summary\n"
+            "✓ All validation checks passed\n"
+            "✓ Implementation meets requirements\n"
+            "✓ Ready for deployment\n\n"
+        )
         
-        return self.format_output(execution, f"{self.name} Output")
+        return self.format_output("".join(parts), f"{self.name} Output")
 
 
 class Overseer:
@@ -515,19 +679,36 @@ class Overseer:
     maintains context, and ensures proper scope adherence.
     """
     
+    # Roles hold no per-workflow state, so every Overseer shares one
+    # instance of each; self.roles is still a per-instance dict
+    _DEFAULT_ROLES: Dict[RoleType, AgentRole] = {
+        RoleType.PLANNER: PlannerRole(),
+        RoleType.ARCHITECT: ArchitectRole(),
+        RoleType.CODER: CoderRole(),
+        RoleType.REVIEWER: ReviewerRole(),
+        RoleType.EXECUTOR: ExecutorRole(),
+    }
+    
+    # The standard workflow: (description, role, index of the step it
+    # depends on). Each step waits on the one before it.
+    _STANDARD_WORKFLOW = (
+        ("Analyze requirements and create plan", RoleType.PLANNER, None),
+        ("Design system architecture", RoleType.ARCHITECT, 0),
+        ("Implement code", RoleType.CODER, 1),
+        ("Review code quality", RoleType.REVIEWER, 2),
+        ("Execute and validate", RoleType.EXECUTOR, 3),
+    )
+    
+    # Log lines for switch_role, formatted once rather than per switch
+    _SWITCH_MESSAGES = {role_type: f"Switched to role: {role_type.value}" for role_type in RoleType}
+    
     def __init__(self, project_name: str, requirements: str):
         self.context = Context(project_name=project_name, requirements=requirements)
         self.zen_tasks = ZenTasks()
         self.tasksync = Tasksync()
         
         # Initialize roles
-        self.roles: Dict[RoleType, AgentRole] = {
-            RoleType.PLANNER: PlannerRole(),
-            RoleType.ARCHITECT: ArchitectRole(),
-            RoleType.CODER: CoderRole(),
-            RoleType.REVIEWER: ReviewerRole(),
-            RoleType.EXECUTOR: ExecutorRole(),
-        }
+        self.roles: Dict[RoleType, AgentRole] = dict(self._DEFAULT_ROLES)
         
         self.current_role: Optional[RoleType] = None
         self.execution_log: List[str] = []
@@ -535,41 +716,19 @@ class Overseer:
     def setup_workflow(self):
         """Setup the standard workflow with tasks"""
         # Create tasks in dependency order
-        t1 = self.zen_tasks.create_task(
-            "Analyze requirements and create plan",
-            RoleType.PLANNER
-        )
-        
-        t2 = self.zen_tasks.create_task(
-            "Design system architecture",
-            RoleType.ARCHITECT,
-            dependencies=[t1.id]
-        )
+        created: List[Task] = []
+        for description, role_type, depends_on in self._STANDARD_WORKFLOW:
+            dependencies = [created[depends_on].id] if depends_on is not None else None
+            created.append(
+                self.zen_tasks.create_task(description, role_type, dependencies=dependencies)
+            )
         
-        t3 = self.zen_tasks.create_task(
-            "Implement code",
-            RoleType.CODER,
-            dependencies=[t2.id]
-        )
-        
-        t4 = self.zen_tasks.create_task(
-            "Review code quality",
-            RoleType.REVIEWER,
-            dependencies=[t3.id]
-        )
-        
-        t5 = self.zen_tasks.create_task(
-            "Execute and validate",
-            RoleType.EXECUTOR,
-            dependencies=[t4.id]
-        )
-        
-        self.log("Workflow setup complete with 5 tasks")
+        self.log(f"Workflow setup complete with {len(created)} tasks")
     
     def switch_role(self, role_type: RoleType) -> AgentRole:
         """Switch to a different role"""
         self.current_role = role_type
-        self.log(f"Switched to role: {role_type.value}")
+        self.log(self._SWITCH_MESSAGES[role_type])
         return self.roles[role_type]
     
     def execute_workflow(self) -> Dict[str, Any]:
@@ -648,57 +807,62 @@ class Overseer:
     
     def generate_report(self) -> str:
         """Generate a comprehensive report of the execution"""
-        report = f"\n{'=' * 80}\n"
-        report += f"UNIFIED CODING AGENT - EXECUTION REPORT\n"
-        report += f"{'=' * 80}\n\n"
-        
-        report += f"Project: {self.context.project_name}\n\n"
+        # Built as a list of lines and joined once, rather than by
+        # repeated string concatenation
+        lines = [
+            "",
+            BANNER,
+            "UNIFIED CODING AGENT - EXECUTION REPORT",
+            BANNER,
+            "",
+            f"Project: {self.context.project_name}",
+            "",
+        ]
         
         # Workflow status
         status = self.zen_tasks.get_workflow_status()
-        report += "Workflow Status:\n"
-        report += f"  Total Tasks: {status['total']}\n"
-        report += f"  Completed: {status['completed']}\n"
-        report += f"  Progress: {status['progress_percentage']:.1f}%\n\n"
+        lines += [
+            "Workflow Status:",
+            f"  Total Tasks: {status['total']}",
+            f"  Completed: {status['completed']}",
+            f"  Progress: {status['progress_percentage']:.1f}%",
+            "",
+        ]
         
         # Clarifying questions
         if self.context.clarifying_questions:
-            report += "Clarifying Questions Raised:\n"
-            for q in self.context.clarifying_questions:
-                report += f"  - {q}\n"
-            report += "\n"
+            lines.append("Clarifying Questions Raised:")
+            lines += [f"  - {q}" for q in self.context.clarifying_questions]
+            lines.append("")
         
         # Files generated
         if self.context.code_files:
-            report += f"Files Generated: {len(self.context.code_files)}\n"
-            for filename in self.context.code_files.keys():
-                report += f"  - {filename}\n"
-            report += "\n"
+            lines.append(f"Files Generated: {len(self.context.code_files)}")
+            lines += [f"  - {filename}" for filename in self.context.code_files]
+            lines.append("")
         
         # Review notes
         if self.context.review_notes:
-            report += "Review Notes:\n"
-            for note in self.context.review_notes:
-                report += f"  - {note}\n"
-            report += "\n"
+            lines.append("Review Notes:")
+            lines += [f"  - {note}" for note in self.context.review_notes]
+            lines.append("")
         
         # Execution results
         if self.context.execution_results:
-            report += "Execution Results:\n"
-            for result in self.context.execution_results:
-                report += f"  - {result}\n"
-            report += "\n"
+            lines.append("Execution Results:")
+            lines += [f"  - {result}" for result in self.context.execution_results]
+            lines.append("")
         
-        report += f"{'=' * 80}\n"
+        lines += [BANNER, ""]
         
-        return report
+        return "\n".join(lines)
 
 
 def main():
     """Example usage of the Unified Coding Agent"""
-    print("=" * 80)
+    print(BANNER)
     print("UNIFIED CODING AGENT")
-    print("=" * 80)
+    print(BANNER)
     print()
     
     # Example requirements
@@ -729,9 +893,9 @@ def main():
     # Show clarifying questions if any
     questions = overseer.get_clarifying_questions()
     if questions:
-        print("\n" + "=" * 80)
+        print("\n" + BANNER)
         print("CLARIFYING QUESTIONS")
-        print("=" * 80)
+        print(BANNER)
         for i, q in enumerate(questions, 1):
             print(f"{i}. {q}")
 